@@ -0,0 +1,316 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from transformer_cache import get_transformer
+
+#Размер части при пересчёте с отображением прогресса
+PROGRESS_CHUNK = 50_000
+
+#Поправки для местных систем Геонац (вычитаются из исходных координат)
+hantos_fields = {
+    "UTM Геонац 42N (Приобское) (32642)":[69.204, 50.538],
+    "UTM Геонац 42N (Зимнее) (32642)":[68.885, 51.173],
+    "UTM Геонац 42N (Красноленинское) (32642)":[70.117, 50.83],
+    "UTM Геонац 43N (Мало-Юганское) (32643)":[56.005, 43.855],
+    "UTM Геонац 43N (Орехово-Ермаковское) (32643)":[56.237, 43.463]
+}
+
+def get_popravki(crs_name:str):
+    """Возвращает поправки Геонац для указанной СК (или нули)"""
+    return hantos_fields.get(crs_name, [0, 0])
+
+def resolve_crs(crs):
+    """Полное имя СК и код EPSG.
+
+    Принимает готовую пару (имя, код) из каталога или слова строки СК,
+    тогда код берётся из последнего слова
+    """
+    if isinstance(crs, tuple):
+        return crs
+    numbers = "0123456789"
+    return " ".join(crs), int("".join([i for i in crs[-1] if i in numbers]))
+
+def extract_column(rows, col:int):
+    """Достаёт один столбец из списка строк, недостающие ячейки заменяются пустыми"""
+    return [row[col] if col < len(row) else "" for row in rows]
+
+#Пробелы (в т.ч. неразрывные из русского Excel) как разделители разрядов удаляются,
+#десятичная запятая заменяется точкой
+_NUMBER_REPLACEMENTS = ((" ", ""), ("\t", ""), ("\r", ""), ("\xa0", ""),
+                        ("\u2007", ""), ("\u202f", ""), ("'", ""), (",", "."))
+
+def _to_float(cell):
+    try:
+        return float(cell)
+    except ValueError:
+        return np.nan
+
+def parse_column(values):
+    """Разбирает столбец строк в массив float64 за один проход.
+
+    Понимает десятичную запятую и точку, пробелы и неразрывные пробелы между
+    разрядами ("6 620 170,5") и ведущий "+". Возвращает массив значений (NaN для
+    нераспознанных ячеек), маску корректных ячеек и номера некорректных
+    """
+    n = len(values)
+    # Очистка всего столбца сразу: замены над одной объединённой строкой
+    try:
+        text = "\n".join(values)
+    except TypeError:
+        text = "\n".join(map(str, values))
+    for old, new in _NUMBER_REPLACEMENTS:
+        if old in text:
+            text = text.replace(old, new)
+    cells = text.split("\n")
+    if len(cells) != n:
+        cells = ["".join(str(value).split()).replace(",", ".") for value in values]
+
+    try:
+        parsed = np.fromiter(map(float, cells), dtype=np.float64, count=n)
+    except ValueError:
+        # Есть нечисловые ячейки — они становятся NaN
+        parsed = np.fromiter(map(_to_float, cells), dtype=np.float64, count=n)
+    valid = np.isfinite(parsed)
+    parsed[~valid] = np.nan
+    return parsed, valid, np.flatnonzero(~valid)
+
+def transform_arrays(transformer, xx, yy, valid=None):
+    """Пересчитывает массивы координат одним вызовом Transformer.
+
+    Вместо исключений для отдельных точек возвращает маску корректных строк
+    """
+    xx = np.ascontiguousarray(xx, dtype=np.float64)
+    yy = np.ascontiguousarray(yy, dtype=np.float64)
+    if valid is None:
+        valid = ~(np.isnan(xx) | np.isnan(yy))
+    out_x, out_y = transformer.transform(xx, yy, errcheck=False)
+    out_x = np.asarray(out_x, dtype=np.float64)
+    out_y = np.asarray(out_y, dtype=np.float64)
+    valid = valid & np.isfinite(out_x) & np.isfinite(out_y)
+    out_x[~valid] = np.nan
+    out_y[~valid] = np.nan
+    return out_x, out_y, valid
+
+def dedup_points(xx, yy, valid):
+    """Оставляет только уникальные пары (x, y) среди корректных строк.
+
+    Возвращает уникальные x, y и для каждой корректной строки номер её пары
+    """
+    codes, uniques = pd.factorize(xx[valid] + 1j * yy[valid])
+    uniques = np.asarray(uniques, dtype=np.complex128)
+    return np.ascontiguousarray(uniques.real), np.ascontiguousarray(uniques.imag), codes
+
+def scatter_points(valid, codes, result):
+    """Раскладывает результат пересчёта уникальных пар обратно по всем строкам"""
+    unique_x, unique_y, unique_valid = result
+    n = len(valid)
+    out_x = np.full(n, np.nan)
+    out_y = np.full(n, np.nan)
+    out_valid = np.zeros(n, dtype=bool)
+    out_x[valid] = unique_x[codes]
+    out_y[valid] = unique_y[codes]
+    out_valid[valid] = unique_valid[codes]
+    return out_x, out_y, out_valid
+
+def transform_unique(xx, yy, valid, transform):
+    """Пересчитывает повторяющиеся точки один раз: transform(x, y) получает
+    только уникальные пары, результат раскладывается по всем строкам.
+
+    Возвращает массивы координат, маску корректных строк и число уникальных точек
+    """
+    unique_x, unique_y, codes = dedup_points(xx, yy, valid)
+    out_x, out_y, out_valid = scatter_points(valid, codes, transform(unique_x, unique_y))
+    return out_x, out_y, out_valid, len(unique_x)
+
+def transform_in_chunks(transformer, xx, yy, valid, progress=None, is_cancelled=None,
+                        chunksize=PROGRESS_CHUNK):
+    """Пересчёт массивов частями с отчётом о прогрессе и возможностью отмены.
+
+    progress(done, total) вызывается после каждой части, при is_cancelled() == True
+    пересчёт прерывается и возвращается None
+    """
+    n = len(xx)
+    out_x = np.empty(n, dtype=np.float64)
+    out_y = np.empty(n, dtype=np.float64)
+    out_valid = np.empty(n, dtype=bool)
+    for lo in range(0, n, chunksize):
+        if is_cancelled is not None and is_cancelled():
+            return None
+        hi = min(lo + chunksize, n)
+        out_x[lo:hi], out_y[lo:hi], out_valid[lo:hi] = transform_arrays(
+            transformer, xx[lo:hi], yy[lo:hi], valid[lo:hi])
+        if progress is not None:
+            progress(hi, n)
+    return out_x, out_y, out_valid
+
+class LazyResult:
+    """Результат пересчёта, заполняемый блоками по запросу.
+
+    Блок, в который попала запрошенная строка, пересчитывается сразу
+    (для видимой части таблицы), остальные дозаполняются через fill().
+    Перед дозаполнением повторяющиеся точки выделяются по всей таблице
+    и дальше считаются один раз; если их много, а workers != 1,
+    fill() пересчитывает их пулом процессов
+    """
+    BLOCK = 512
+    FILL_BLOCKS = 64
+
+    def __init__(self, transformer, xx, yy, valid, source_crs=None, target_crs=None, workers=1):
+        n = len(xx)
+        self.transformer = transformer
+        self.source_crs, self.target_crs = source_crs, target_crs
+        self.workers = workers
+        self.xx, self.yy, self.valid_in = xx, yy, valid
+        self.codes = None
+        self.out_x = np.full(n, np.nan)
+        self.out_y = np.full(n, np.nan)
+        self.valid = np.zeros(n, dtype=bool)
+        self.done = np.zeros(-(-n // self.BLOCK), dtype=bool)
+        self.dedup_stats = None
+
+    def __len__(self):
+        return len(self.out_x)
+
+    @property
+    def complete(self):
+        return bool(self.done.all())
+
+    def prepare_dedup(self):
+        """Выделяет уникальные точки всей таблицы (выполняется в фоне перед fill)"""
+        unique_x, unique_y, codes = dedup_points(self.xx, self.yy, self.valid_in)
+        self.unique_x, self.unique_y = unique_x, unique_y
+        self.unique_out = np.full((2, len(unique_x)), np.nan)
+        self.unique_valid = np.zeros(len(unique_x), dtype=bool)
+        self.unique_done = np.zeros(len(unique_x), dtype=bool)
+        self.dedup_stats = {'rows': len(codes), 'unique': len(unique_x)}
+        row_codes = np.full(len(self), -1, dtype=np.intp)
+        row_codes[self.valid_in] = codes
+        # Присваиваем последним: до этого блоки считаются построчно
+        self.codes = row_codes
+
+    def compute_block(self, block, count=1):
+        """Пересчитывает count блоков подряд, начиная с block"""
+        lo = block * self.BLOCK
+        hi = min(lo + self.BLOCK * count, len(self))
+        row_codes = self.codes
+        if row_codes is None:
+            self.out_x[lo:hi], self.out_y[lo:hi], self.valid[lo:hi] = transform_arrays(
+                self.transformer, self.xx[lo:hi], self.yy[lo:hi], self.valid_in[lo:hi])
+            self.done[block:block + count] = True
+            return
+
+        codes = row_codes[lo:hi]
+        rows = codes >= 0
+        codes = codes[rows]
+        need = np.unique(codes[~self.unique_done[codes]])
+        if len(need):
+            x, y, ok = transform_arrays(self.transformer, self.unique_x[need], self.unique_y[need])
+            self.unique_out[0, need], self.unique_out[1, need] = x, y
+            self.unique_valid[need] = ok
+            self.unique_done[need] = True
+        self.out_x[lo:hi][rows] = self.unique_out[0, codes]
+        self.out_y[lo:hi][rows] = self.unique_out[1, codes]
+        self.valid[lo:hi][rows] = self.unique_valid[codes]
+        self.done[block:block + count] = True
+
+    def ensure(self, row):
+        """Гарантирует, что строка уже пересчитана"""
+        block = row // self.BLOCK
+        if not self.done[block]:
+            self.compute_block(block)
+
+    def fill(self, progress=None, is_cancelled=None):
+        """Пересчитывает все ещё не готовые блоки; False, если прервано через is_cancelled"""
+        if self.codes is None:
+            self.prepare_dedup()
+        if self.workers != 1 and self.source_crs is not None:
+            need = np.flatnonzero(~self.unique_done)
+            from parallel import PARALLEL_MIN_POINTS, transform_parallel
+            if len(need) >= PARALLEL_MIN_POINTS:
+                # Для больших объёмов — пул процессов (workers=None — по числу ядер),
+                # блоки ниже только раскладывают готовые точки по строкам
+                result = transform_parallel(self.source_crs, self.target_crs,
+                                            self.unique_x[need], self.unique_y[need],
+                                            workers=self.workers, progress=progress,
+                                            is_cancelled=is_cancelled)
+                if result is None:
+                    return False
+                x, y, ok = result
+                self.unique_out[0, need], self.unique_out[1, need] = x, y
+                self.unique_valid[need] = ok
+                self.unique_done[need] = True
+                progress = None
+        total = len(self)
+        # В фоне считаем сразу по FILL_BLOCKS блоков, пропуская уже готовые
+        for first in range(0, len(self.done), self.FILL_BLOCKS):
+            if is_cancelled is not None and is_cancelled():
+                return False
+            last = min(first + self.FILL_BLOCKS, len(self.done))
+            if not self.done[first:last].any():
+                self.compute_block(first, last - first)
+            else:
+                for block in range(first, last):
+                    if not self.done[block]:
+                        self.compute_block(block)
+            if progress is not None:
+                progress(min(last * self.BLOCK, total), total)
+        return True
+
+class Perevod:
+    """Задание на перевод координат.
+
+    СК и Transformer определяются при создании, пересчёт выполняется
+    через LazyResult (lazy_result) или по отдельным строкам (transform_rows)
+    """
+    def __init__(self, source_crs, target_crs, model, workers=1):
+        self.crs_name, self.source_crs = resolve_crs(source_crs)
+        _, self.target_crs = resolve_crs(target_crs)
+        self.transformer = get_transformer(self.source_crs, self.target_crs)
+        self.model = model
+        self.headers = model._headers
+        self.workers = workers
+        self.bad_rows = None
+        self.timings = {'parse': None, 'transform': None}
+
+    def find_coord_columns(self):
+        """Находит индексы столбцов с координатами по заголовкам"""
+        long = lat = None
+        for x, y in enumerate(self.headers):
+            if y == "Долгота/X":
+                long = x
+            if y == "Широта/Y":
+                lat = x
+        if long is None or lat is None:
+            raise ValueError("Не найдены столбцы 'Долгота/X' и 'Широта/Y'")
+        return long, lat
+
+    def parse_rows(self, rows=None):
+        """Столбцы с координатами указанных строк (всех при rows=None) с учётом поправок Геонац"""
+        popravka_1, popravka_2 = get_popravki(self.crs_name)
+        long, lat = self.find_coord_columns()
+
+        # Столбцы координат модель хранит в float64, повторный разбор текста не нужен
+        xx, valid_x = self.model.numeric_column(lat, rows)
+        yy, valid_y = self.model.numeric_column(long, rows)
+        return xx - popravka_1, yy - popravka_2, valid_x & valid_y
+
+    def parse(self):
+        """Столбцы с координатами в виде массивов float64"""
+        start = time.perf_counter()
+        result = self.parse_rows()
+        self.bad_rows = np.flatnonzero(~result[2])
+        self.timings['parse'] = time.perf_counter() - start
+        return result
+
+    def transform_rows(self, indices):
+        """Пересчитывает только указанные строки (результат не запоминается)"""
+        xx, yy, valid = self.parse_rows(np.asarray(indices, dtype=np.intp))
+        return transform_arrays(self.transformer, xx, yy, valid)
+
+    def lazy_result(self):
+        """Результат, пересчитываемый блоками по мере обращения к строкам"""
+        xx, yy, valid = self.parse()
+        return LazyResult(self.transformer, xx, yy, valid,
+                          self.source_crs, self.target_crs, self.workers)
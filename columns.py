@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+from batch import parse_column
+
+def format_number(value:float):
+    """Текст числа для отображения и редактирования (без лишнего '.0')"""
+    text = repr(value)
+    return text[:-2] if text.endswith(".0") else text
+
+class TextColumn:
+    """Столбец произвольного текста: хранится как список строк"""
+    kind = 'text'
+
+    def __init__(self, values):
+        self.values = list(values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self, row):
+        return self.values[row]
+
+    def set(self, row, value):
+        self.values[row] = value
+
+    def insert(self, position, values):
+        self.values[position:position] = values
+
+    def delete(self, row):
+        del self.values[row]
+
+    def texts(self, rows=None):
+        if rows is None:
+            return list(self.values)
+        return [self.values[i] for i in rows]
+
+class CategoryColumn:
+    """Столбец наименований: коды в массиве int32 и список уникальных значений"""
+    kind = 'category'
+
+    def __init__(self, values):
+        codes, categories = pd.factorize(pd.Series(list(values), dtype=object))
+        self.codes = codes.astype(np.int32)
+        self.categories = list(categories)
+        self._lookup = {value: code for code, value in enumerate(self.categories)}
+
+    def __len__(self):
+        return len(self.codes)
+
+    def code(self, value):
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(value)
+            self._lookup[value] = code
+        return code
+
+    def get(self, row):
+        return self.categories[self.codes[row]]
+
+    def set(self, row, value):
+        self.codes[row] = self.code(value)
+
+    def insert(self, position, values):
+        self.codes = np.insert(self.codes, position,
+                               np.array([self.code(value) for value in values], dtype=np.int32))
+
+    def delete(self, row):
+        self.codes = np.delete(self.codes, row)
+
+    def texts(self, rows=None):
+        codes = self.codes if rows is None else self.codes[rows]
+        return np.array(self.categories, dtype=object)[codes].tolist()
+
+class FloatColumn:
+    """Столбец координат: значения float64, исходный текст хранится только для нераспознанных ячеек"""
+    kind = 'float'
+
+    def __init__(self, values):
+        values = list(values)
+        self.values, _, bad = parse_column(values)
+        self.raw = {int(i): str(values[i]) for i in bad}
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self, row):
+        if row in self.raw:
+            return self.raw[row]
+        return format_number(float(self.values[row]))
+
+    def set(self, row, value):
+        parsed, valid, _ = parse_column([value])
+        self.values[row] = parsed[0]
+        if valid[0]:
+            self.raw.pop(row, None)
+        else:
+            self.raw[row] = str(value)
+
+    def insert(self, position, values):
+        parsed, _, bad = parse_column(values)
+        count = len(values)
+        self.raw = {(row + count if row >= position else row): text
+                    for row, text in self.raw.items()}
+        self.raw.update({position + int(i): str(values[i]) for i in bad})
+        self.values = np.insert(self.values, position, parsed)
+
+    def delete(self, row):
+        self.raw = {(r - 1 if r > row else r): text
+                    for r, text in self.raw.items() if r != row}
+        self.values = np.delete(self.values, row)
+
+    def numeric(self, rows=None):
+        """Значения и маска корректных ячеек без повторного разбора текста"""
+        values = self.values if rows is None else self.values[rows]
+        return values, ~np.isnan(values)
+
+    def texts(self, rows=None):
+        rows = range(len(self.values)) if rows is None else rows
+        return [self.get(row) for row in rows]
+
+COLUMN_TYPES = {'text': TextColumn, 'category': CategoryColumn, 'float': FloatColumn}
+
+def make_column(values, kind='text'):
+    return COLUMN_TYPES[kind](values)
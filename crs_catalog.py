@@ -0,0 +1,462 @@
+import heapq
+import os
+import re
+import sqlite3
+from collections import Counter, defaultdict
+
+import numpy as np
+
+#Файл каталога СК рядом с модулем (в сборке Nuitka подключается как data-файл)
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "crs_catalog.sqlite")
+
+#Код EPSG записан в последних скобках: "WGS 84 (4326)"
+_CODE_PATTERN = re.compile(r"\((\d+)\)\s*$")
+
+def normalize(text:str):
+    """Ключ поиска: нижний регистр, пробелы схлопнуты"""
+    return " ".join(str(text).lower().split())
+
+def entry_code(word:str):
+    """Код EPSG записи словаря (None, если кода нет)"""
+    match = _CODE_PATTERN.search(str(word))
+    return int(match.group(1)) if match else None
+
+#Веса признаков при ранжировании подсказок
+SCORE_EXACT = 1000
+SCORE_CODE = 500
+SCORE_PREFIX = 100
+SCORE_WORD = 50
+SCORE_RECENT = 30
+
+#Виды СК для фильтра: подпись -> типы PROJ
+CRS_KINDS = {
+    "Плоские (проекции)": ("PROJECTED_CRS",),
+    "Географические 2D": ("GEOGRAPHIC_2D_CRS",),
+    "Плоские и географические 2D": ("PROJECTED_CRS", "GEOGRAPHIC_2D_CRS"),
+    "Географические 3D": ("GEOGRAPHIC_3D_CRS",),
+    "Геоцентрические": ("GEOCENTRIC_CRS",),
+    "Высотные": ("VERTICAL_CRS",),
+    "Составные": ("COMPOUND_CRS",),
+}
+
+#Районы для фильтра по области применения: подпись -> (запад, юг, восток, север), градусы
+REGIONS = {
+    "ХМАО-Югра": (59.0, 58.5, 86.0, 65.7),
+    "Западная Сибирь": (60.0, 53.0, 90.0, 73.5),
+}
+
+def datum_family(name):
+    """Семейство датума: имя без реализации в скобках и без слова ensemble"""
+    if not name:
+        return None
+    name = re.sub(r"\s*\(.*?\)", "", name)
+    return re.sub(r"\s+ensemble$", "", name).strip()
+
+def trigrams(key:str):
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+class SearchIndex:
+    """Индекс поиска СК по подстроке.
+
+    Ключи приводятся к нижнему регистру один раз при загрузке, для каждой
+    тройки символов хранится множество номеров записей, в которых она
+    встречается. Подстрока ищется пересечением этих множеств с проверкой
+    кандидатов, так что перебирается не весь словарь, а только подходящие записи
+    """
+    def __init__(self, words, keys=None, codes=None):
+        self.words = list(words)
+        self.keys = [normalize(word) for word in self.words] if keys is None else list(keys)
+        self.codes = [entry_code(word) for word in self.words] if codes is None else list(codes)
+        #Код EPSG -> номера записей (у одного кода может быть несколько записей, напр. Геонац)
+        self.by_code = defaultdict(list)
+        for i, code in enumerate(self.codes):
+            if code is not None:
+                self.by_code[code].append(i)
+        #Нормализованное имя -> номер записи (первой, если имена повторяются)
+        self.by_key = {}
+        for i, key in enumerate(self.keys):
+            self.by_key.setdefault(key, i)
+        self._postings = None
+
+    @property
+    def postings(self):
+        """Тройка символов -> номера записей; строится при первом обращении"""
+        if self._postings is None:
+            postings = defaultdict(set)
+            for i, key in enumerate(self.keys):
+                for trigram in trigrams(key):
+                    postings[trigram].add(i)
+            self._postings = {trigram: frozenset(rows) for trigram, rows in postings.items()}
+        return self._postings
+
+    def __len__(self):
+        return len(self.words)
+
+    def entry(self, i):
+        """Имя и код EPSG записи"""
+        return str(self.words[i]), self.codes[i]
+
+    def search(self, query:str, allowed=None):
+        """Номера записей, содержащих query, в порядке словаря.
+
+        Если query — число, записи с таким кодом EPSG идут первыми.
+        allowed — маска записей, прошедших фильтры (None — без фильтров)
+        """
+        query = normalize(query)
+        if query.isdigit():
+            exact = self.by_code.get(int(query), [])
+            if allowed is not None:
+                exact = [i for i in exact if allowed[i]]
+            if exact:
+                exact_rows = set(exact)
+                return exact + [i for i in self.find(query, allowed) if i not in exact_rows]
+        return self.find(query, allowed)
+
+    def score(self, i, query:str, recent=()):
+        """Релевантность записи для запроса (больше — выше в списке).
+
+        recent — номер записи -> место среди недавно использованных (0 — последняя)
+        """
+        key = self.keys[i]
+        score = SCORE_RECENT - recent[i] if i in recent else 0
+        if not query:
+            return score
+        if key == query:
+            return score + SCORE_EXACT
+        if query.isdigit() and self.codes[i] == int(query):
+            score += SCORE_CODE
+        position = key.find(query)
+        if position == 0:
+            score += SCORE_PREFIX
+        elif not key[position - 1].isalnum() or " " + query in key or "(" + query in key:
+            score += SCORE_WORD
+        return score
+
+    def ranked(self, query:str, recent=(), allowed=None):
+        """Подходящие записи для постраничного вывода по убыванию релевантности"""
+        return RankedResult(self, normalize(query), self.search(query, allowed), recent)
+
+    def find(self, query:str, allowed=None):
+        """Поиск по подстроке нормализованного ключа среди записей, прошедших фильтры"""
+        if allowed is not None:
+            # Фильтры применяются до текстового поиска: проверяются только их записи
+            rows = np.flatnonzero(allowed).tolist()
+            if not query:
+                return rows
+            if len(query) < 3:
+                keys = self.keys
+                return [i for i in rows if query in keys[i]]
+        elif not query:
+            return list(range(len(self.keys)))
+        elif len(query) < 3:
+            # Одна-две буквы встречаются почти везде, индекс тут не поможет
+            return [i for i, key in enumerate(self.keys) if query in key]
+
+        postings = self.postings
+        lists = []
+        for trigram in trigrams(query):
+            rows = postings.get(trigram)
+            if rows is None:
+                return []
+            lists.append(rows)
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        if allowed is not None:
+            candidates = {i for i in candidates if allowed[i]}
+        for rows in lists[1:]:
+            candidates &= rows
+            if not candidates:
+                return []
+        # Тройки могут идти в записи не подряд, поэтому кандидатов проверяем
+        keys = self.keys
+        return sorted(i for i in candidates if query in keys[i])
+
+    def is_exact(self, text:str):
+        """Совпадает ли текст целиком с именем одной из записей"""
+        return normalize(text) in self.by_key
+
+    def row_of(self, text:str):
+        """Номер записи с точно таким именем (None, если её нет)"""
+        return self.by_key.get(normalize(text))
+
+    def resolve(self, text:str):
+        """Имя и код EPSG записи с точно таким именем (None, если её нет)"""
+        i = self.row_of(text)
+        return None if i is None else self.entry(i)
+
+class RankedResult:
+    """Результат поиска, ранжированный по запросу.
+
+    Полная сортировка не выполняется: top(k) выбирает k лучших записей
+    ограниченной кучей, следующие страницы добираются по мере прокрутки
+    """
+    def __init__(self, index, query, rows, recent=()):
+        self.index = index
+        self.query = query
+        self.rows = rows
+        self.recent = {}
+        for position, row in enumerate(recent):
+            self.recent.setdefault(row, position)
+        self._top = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def top(self, k):
+        """k лучших записей; при равной релевантности — в порядке словаря"""
+        k = min(k, len(self.rows))
+        if len(self._top) < k:
+            score = self.index.score
+            query, recent = self.query, self.recent
+            # При равной релевантности выше запись с меньшим номером
+            self._top = [row for _, row in heapq.nsmallest(
+                k, ((-score(row, query, recent), row) for row in self.rows))]
+        return self._top[:k]
+
+class CrsFacets:
+    """Фильтры перечня СК по виду, семейству датума и району.
+
+    Для каждого значения фильтра один раз строится маска записей (массив bool),
+    сочетание фильтров — логическое И готовых масок
+    """
+    def __init__(self, types, families, bounds):
+        self.types = np.array(types, dtype=object)
+        self.families = np.array(families, dtype=object)
+        #Границы области применения: запад, юг, восток, север (NaN, если неизвестны)
+        self.bounds = np.array(bounds, dtype=np.float64).reshape(-1, 4)
+        self._masks = {}
+
+    def __len__(self):
+        return len(self.types)
+
+    def _cached(self, key, build):
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._masks[key] = build()
+        return mask
+
+    def kind_mask(self, kind:str):
+        return self._cached(('kind', kind), lambda: np.isin(self.types, CRS_KINDS[kind]))
+
+    def datum_mask(self, family:str):
+        return self._cached(('datum', family), lambda: self.families == family)
+
+    def region_mask(self, region:str):
+        """Записи, область применения которых пересекается с районом"""
+        def build():
+            west, south, east, north = REGIONS[region]
+            b = self.bounds
+            # Области через 180-й меридиан (запад > восток) считаем охватывающими всю долготу
+            crosses = b[:, 0] > b[:, 2]
+            by_lon = crosses | ((b[:, 0] <= east) & (b[:, 2] >= west))
+            return by_lon & (b[:, 1] <= north) & (b[:, 3] >= south)
+        return self._cached(('region', region), build)
+
+    def mask(self, kind=None, datum=None, region=None):
+        """Маска записей, прошедших все заданные фильтры (None — фильтров нет)"""
+        masks = []
+        if kind:
+            masks.append(self.kind_mask(kind))
+        if datum:
+            masks.append(self.datum_mask(datum))
+        if region:
+            masks.append(self.region_mask(region))
+        if not masks:
+            return None
+        return np.logical_and.reduce(masks)
+
+    def datum_families(self):
+        """Семейства датумов по убыванию числа СК"""
+        return [family for family, _ in Counter(f for f in self.families if f).most_common()]
+
+#Поля записи каталога, возвращаемые CrsCatalog.details
+CATALOG_FIELDS = ("code", "name", "type", "datum", "datum_family", "area",
+                  "west", "south", "east", "north", "key")
+
+#Версия структуры файла каталога: при её изменении каталог пересобирается
+CATALOG_FORMAT = 2
+
+def proj_crs_info():
+    """Сведения о действующих СК EPSG из базы PROJ по коду.
+
+    Берутся все неустаревшие СК с числовым кодом, возможность пересчёта
+    между ними заранее не проверяется
+    """
+    from pyproj.database import query_crs_info
+    return {int(info.code): info for info in query_crs_info(auth_name="EPSG") if info.code.isdigit()}
+
+def proj_database_version():
+    """Версии базы PROJ, из которой строится каталог"""
+    from pyproj.database import get_database_metadata
+    return {'format': str(CATALOG_FORMAT),
+            'proj': get_database_metadata("PROJ.VERSION"),
+            'epsg': get_database_metadata("EPSG.VERSION"),
+            'layout': "{}.{}".format(get_database_metadata("DATABASE.LAYOUT.VERSION.MAJOR"),
+                                     get_database_metadata("DATABASE.LAYOUT.VERSION.MINOR"))}
+
+def read_catalog_version(path=CATALOG_PATH):
+    """Версии, записанные в файле каталога (None, если файла нет или он без версии)"""
+    if not os.path.exists(path):
+        return None
+    connection = sqlite3.connect(path)
+    try:
+        return dict(connection.execute("SELECT key, value FROM meta").fetchall())
+    except sqlite3.Error:
+        return None
+    finally:
+        connection.close()
+
+def catalog_words(infos):
+    """Записи каталога: WGS 84 и местные системы Геонац первыми, затем СК EPSG по коду"""
+    from batch import hantos_fields
+    words = ["WGS 84 (4326)", *hantos_fields]
+    pinned = set(words)
+    for code in sorted(infos):
+        word = f"{infos[code].name} ({code})"
+        if word not in pinned:
+            words.append(word)
+    return words
+
+def generate_catalog(path=CATALOG_PATH, force=False):
+    """Строит каталог из базы PROJ, поставляемой с pyproj (без сети).
+
+    Если каталог уже построен из базы той же версии, пересборка пропускается
+    и возвращается None, иначе — число записей
+    """
+    version = proj_database_version()
+    if not force and read_catalog_version(path) == version:
+        return None
+    infos = proj_crs_info()
+    return build_catalog(catalog_words(infos), path, infos, version)
+
+def crs_datum(code):
+    """Имя датума СК (для составных — датум горизонтальной части)"""
+    from pyproj import CRS
+    from pyproj.exceptions import CRSError
+    try:
+        crs = CRS.from_epsg(code)
+    except CRSError:
+        return None
+    datum = crs.datum
+    if datum is None and crs.sub_crs_list:
+        datum = crs.sub_crs_list[0].datum
+    return datum.name if datum is not None else None
+
+def build_catalog(words, path=CATALOG_PATH, infos=None, version=None):
+    """Записывает каталог СК в файл SQLite.
+
+    Порядок записей сохраняется (номер записи = номер в списке), для каждой
+    хранятся код EPSG, имя для показа, тип СК, датум и нормализованный ключ поиска.
+    Области применения повторяются у многих СК, поэтому лежат в отдельной таблице
+    """
+    if infos is None:
+        infos = proj_crs_info()
+    areas = {}
+    datums = {}
+    rows = []
+    for i, word in enumerate(words):
+        code = entry_code(word)
+        info = infos.get(code)
+        crs_type = area_id = datum = None
+        if info is not None:
+            crs_type = info.type.name
+            area = info.area_of_use
+            if area is not None:
+                bounds = (area.name, area.west, area.south, area.east, area.north)
+                area_id = areas.setdefault(bounds, len(areas))
+            if code not in datums:
+                datums[code] = crs_datum(code)
+            datum = datums[code]
+        rows.append((i, code, str(word), crs_type, datum, datum_family(datum), area_id,
+                     normalize(word)))
+
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        connection.executemany("INSERT INTO meta VALUES (?, ?)", (version or {}).items())
+        connection.execute("CREATE TABLE area (id INTEGER PRIMARY KEY, name TEXT, "
+                           "west REAL, south REAL, east REAL, north REAL)")
+        connection.execute("CREATE TABLE crs (id INTEGER PRIMARY KEY, code INTEGER, name TEXT, "
+                           "type TEXT, datum TEXT, datum_family TEXT, area_id INTEGER, key TEXT)")
+        connection.executemany("INSERT INTO area VALUES (?, ?, ?, ?, ?, ?)",
+                               [(area_id, *bounds) for bounds, area_id in areas.items()])
+        connection.executemany("INSERT INTO crs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        connection.commit()
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+    os.replace(tmp_path, path)
+    return len(rows)
+
+class CrsCatalog:
+    """Каталог СК из файла SQLite.
+
+    Файл открывается только для чтения при первом обращении, имена и ключи
+    для индекса поиска читаются одним запросом, подробности о СК — по записи
+    """
+    def __init__(self, path=CATALOG_PATH):
+        self.path = path
+        self._connection = None
+        self._index = None
+        self._facets = None
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            uri = "file:" + self.path.replace("\\", "/") + "?mode=ro"
+            self._connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        return self._connection
+
+    @property
+    def index(self):
+        """Индекс поиска по всем записям каталога"""
+        if self._index is None:
+            rows = self.connection.execute("SELECT name, key, code FROM crs ORDER BY id").fetchall()
+            words, keys, codes = zip(*rows) if rows else ((), (), ())
+            self._index = SearchIndex(words, keys, codes)
+        return self._index
+
+    @property
+    def facets(self):
+        """Фильтры по виду СК, датуму и району"""
+        if self._facets is None:
+            rows = self.connection.execute(
+                "SELECT crs.type, crs.datum_family, area.west, area.south, area.east, area.north "
+                "FROM crs LEFT JOIN area ON area.id = crs.area_id ORDER BY crs.id").fetchall()
+            types = [row[0] for row in rows]
+            families = [row[1] for row in rows]
+            bounds = [[np.nan if v is None else v for v in row[2:]] for row in rows]
+            self._facets = CrsFacets(types, families, bounds)
+        return self._facets
+
+    def details(self, i):
+        """Все поля записи каталога в виде словаря"""
+        row = self.connection.execute(
+            "SELECT crs.code, crs.name, crs.type, crs.datum, crs.datum_family, "
+            "area.name, area.west, area.south, area.east, "
+            "area.north, crs.key FROM crs LEFT JOIN area ON area.id = crs.area_id "
+            "WHERE crs.id = ?", (i,)).fetchone()
+        return dict(zip(CATALOG_FIELDS, row)) if row else None
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+#Общий каталог на процесс
+catalog = CrsCatalog()
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Построение каталога СК из базы PROJ")
+    parser.add_argument("--force", action="store_true", help="пересобрать даже при той же версии базы")
+    parser.add_argument("-o", "--output", default=CATALOG_PATH, help="файл каталога")
+    args = parser.parse_args()
+    count = generate_catalog(args.output, args.force)
+    if count is None:
+        print(f"Каталог уже построен из этой версии базы PROJ: {read_catalog_version(args.output)}")
+    else:
+        print(f"Записей в каталоге: {count} ({args.output})")
@@ -1,16 +1,43 @@
 
+import json
+import multiprocessing
+import time
+
+import numpy as np
 import pandas as pd
-from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, 
-                              QListWidget, QLineEdit,QFileDialog,
+from pyproj.exceptions import CRSError, ProjError
+from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
+                              QListView, QLineEdit,QFileDialog,
                               QLabel, QDialog, QComboBox, QDialogButtonBox, 
-                              QMessageBox, QHeaderView, QTableView)
+                              QMessageBox, QHeaderView, QTableView, QPushButton,
+                              QSpinBox)
 from PySide6.QtGui import QShortcut, QKeySequence
-from PySide6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
+from PySide6.QtCore import (Qt, QTimer, QAbstractTableModel, QAbstractListModel, QModelIndex,
+                            QAbstractProxyModel, QThread, Signal, QSettings)
 
-from pyproj import Transformer
-from dictionary import data
+from batch import Perevod, extract_column, parse_column, resolve_crs
+from columns import make_column
+from crs_catalog import CRS_KINDS, REGIONS, catalog
+from transformer_cache import get_transformer
 from ui.ui_main import Ui_mainWindow
 
+#Сколько недавно выбранных СК учитывается при ранжировании подсказок
+RECENT_CRS_LIMIT = 10
+#Последние пары СК хранятся между запусками, для первых из них Transformer строится заранее
+RECENT_PAIRS_LIMIT = 10
+PREWARM_PAIRS = 3
+#Пауза в наборе текста перед поиском подсказок, мс
+SEARCH_DELAY = 300
+
+def app_settings():
+    """Настройки приложения (реестр Windows или файл в профиле пользователя)"""
+    return QSettings("SemyonKombarov", "Перевод координат")
+
+def is_crs_entry(value):
+    """Проверяет запись СК из настроек: [имя, код EPSG]"""
+    return (isinstance(value, list) and len(value) == 2 and isinstance(value[0], str)
+            and isinstance(value[1], int) and not isinstance(value[1], bool))
+
 class MainWindow(QMainWindow):
     """Класс инициализирующий главное окно со всем содержимым"""
     def __init__(self):
@@ -19,14 +46,62 @@ class MainWindow(QMainWindow):
         self.ui = Ui_mainWindow()
         self.ui.setupUi(self)
 
-        #Подгрузка словаря
-        self.word_dictionary = data
+        #Каталог СК подгружается после показа окна, чтобы не задерживать запуск
+        self.crs_index = None
+        self.crs_model = None
+        QTimer.singleShot(0, self.load_crs_catalog)
+        #Записи каталога, выбранные из списков подсказок (поле ввода -> (имя, код))
+        self.selected_crs = {}
+        #Недавно выбранные записи поднимаются выше в подсказках (свои для каждого списка)
+        self.recent_crs = {self.ui.listWidget: [], self.ui.listWidget_2: []}
+        #Пары СК последних пересчётов, сохраняются между запусками
+        self.recent_pairs = self.load_recent_pairs()
+        #Фоновые потоки подготовки (Transformer заранее, пересчёт до нажатия кнопки)
+        self.background_workers = set()
+        #Пересчёт, запущенный заранее для выбранной пары СК
+        self.speculative = None
+        for listview in (self.ui.listWidget, self.ui.listWidget_2):
+            listview.setUniformItemSizes(True)
+
+        #Поиск подсказок: один перезапускаемый таймер на поле ввода, результаты
+        #устаревших запросов отбрасываются по номеру поколения
+        self.search_timers = {}
+        self.search_generation = {}
+        self.search_workers = set()
+        for lineedit, listview in ((self.ui.lineEdit, self.ui.listWidget),
+                                   (self.ui.lineEdit_2, self.ui.listWidget_2)):
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(SEARCH_DELAY)
+            timer.timeout.connect(lambda lineedit=lineedit, listview=listview:
+                                  self.start_search(lineedit, listview))
+            self.search_timers[listview] = timer
+
+        #Фильтры перечня СК (общие для обоих списков): вид, семейство датума, район
+        self.crs_filter = None
+        self.kind_box = QComboBox()
+        self.kind_box.addItem("Все виды СК", None)
+        for kind in CRS_KINDS:
+            self.kind_box.addItem(kind, kind)
+        self.datum_box = QComboBox()
+        self.datum_box.addItem("Все датумы", None)
+        self.region_box = QComboBox()
+        self.region_box.addItem("Весь мир", None)
+        for region in REGIONS:
+            self.region_box.addItem(region, region)
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Фильтр СК:"))
+        for box in (self.kind_box, self.datum_box, self.region_box):
+            box.currentIndexChanged.connect(self.on_crs_filter_changed)
+            filter_layout.addWidget(box)
+        filter_layout.addStretch()
+        self.ui.verticalLayout_2.insertLayout(0, filter_layout)
 
         #Подтверждение выбора исходной и целевой СК
-        self.ui.listWidget.itemClicked.connect(lambda item: 
-                self.apply_suggestion(item,self.ui.lineEdit,self.ui.listWidget))
-        self.ui.listWidget_2.itemClicked.connect(lambda item: 
-                self.apply_suggestion(item,self.ui.lineEdit_2,self.ui.listWidget_2))
+        self.ui.listWidget.clicked.connect(lambda index: 
+                self.apply_suggestion(index,self.ui.lineEdit,self.ui.listWidget))
+        self.ui.listWidget_2.clicked.connect(lambda index: 
+                self.apply_suggestion(index,self.ui.lineEdit_2,self.ui.listWidget_2))
 
         #Работа с QLineEdit при определении исходной и целевой СК
         self.ui.lineEdit.textChanged.connect(lambda : 
@@ -34,14 +109,22 @@ class MainWindow(QMainWindow):
         self.ui.lineEdit_2.textChanged.connect(lambda : 
                 self.on_text_changed(self.ui.lineEdit_2,self.ui.listWidget_2))
 
-        #При инициации приложения отображение перечня
-        self.update_suggestions("",self.ui.listWidget)
-        self.update_suggestions("",self.ui.listWidget_2)
-
         #Работа с подгрузкой и выгрузкой данных
         self.model = PandasModel()
         self.ui.tableView.setModel(self.model)
 
+        #Инкрементальный пересчёт: после правки исходной таблицы пересчитываются только изменённые строки
+        self.last_translation = None
+        self.dirty_rows = set()
+        self.incremental_timer = QTimer(self)
+        self.incremental_timer.setSingleShot(True)
+        self.incremental_timer.setInterval(50)
+        self.incremental_timer.timeout.connect(self.apply_incremental)
+        self.model.dataChanged.connect(self.on_source_data_changed)
+        self.model.rowsInserted.connect(self.on_source_rows_inserted)
+        self.model.rowsRemoved.connect(self.on_source_rows_removed)
+        self.model.modelReset.connect(self.on_source_reset)
+
         #Включаем редактирование для обеих таблиц
         self.ui.tableView.setEditTriggers(QTableView.DoubleClicked | QTableView.EditKeyPressed)
         self.ui.tableView_2.setEditTriggers(QTableView.DoubleClicked | QTableView.EditKeyPressed)
@@ -57,6 +140,22 @@ class MainWindow(QMainWindow):
 
         #Пересчёт координат
         self.ui.pushButton_4.clicked.connect(self.perform_translation)
+        self.translation_worker = None
+
+        #Отмена пересчёта (кнопка в строке состояния видна только во время пересчёта)
+        self.cancel_button = QPushButton("Отмена")
+        self.cancel_button.clicked.connect(self.cancel_translation)
+        self.cancel_button.hide()
+        self.ui.statusbar.addPermanentWidget(self.cancel_button)
+
+        #Число знаков после запятой в таблице результата (минимум — без округления)
+        self.decimals_box = QSpinBox()
+        self.decimals_box.setRange(-1, 12)
+        self.decimals_box.setValue(-1)
+        self.decimals_box.setSpecialValueText("Знаков: все")
+        self.decimals_box.setPrefix("Знаков: ")
+        self.decimals_box.valueChanged.connect(self.on_decimals_changed)
+        self.ui.statusbar.addPermanentWidget(self.decimals_box)
 
         #Настройка копирования по Ctrl+C
         self.ui.tableView.setSelectionBehavior(QTableView.SelectItems)
@@ -101,9 +200,7 @@ class MainWindow(QMainWindow):
         else:
             # Если таблица не пуста, добавляем новую строку
             row_position = model.rowCount()
-            model.beginInsertRows(QModelIndex(), row_position, row_position)
-            model._data.append(["" for _ in range(model.columnCount())])
-            model.endInsertRows()
+            model.insert_rows(row_position, [["" for _ in range(model.columnCount())]])
         
         # Прокручиваем к новой строке
         self.ui.tableView.scrollToBottom()
@@ -200,123 +297,453 @@ class MainWindow(QMainWindow):
                               QMessageBox.Ok)  
 
     def perform_translation(self):
-        """Выполняет перевод координат и отображает результаты в tableview_2"""
-        source_crs = self.ui.lineEdit.text().split()
-        target_crs = self.ui.lineEdit_2.text().split()
+        """Запускает перевод координат в фоновом потоке, результат отображается в tableview_2"""
+        if self.translation_worker is not None:
+            return
+
+        source_crs = self.crs_from(self.ui.lineEdit)
+        target_crs = self.crs_from(self.ui.lineEdit_2)
         
         if not source_crs or not target_crs:
             QMessageBox.warning(self, "Ошибка", "Не указана исходная или целевая СК")
             return
+
+        if self.model.column_mapping['lon'] == -1 or self.model.column_mapping['lat'] == -1:
+            QMessageBox.warning(self, "Ошибка", "Не удалось определить столбцы с координатами")
+            return
             
+        key = self.translation_key(source_crs, target_crs)
+        if self.last_translation is not None and self.last_translation['key'] == key:
+            # Та же пара СК и те же столбцы — достаточно пересчитать изменённые строки
+            self.apply_incremental()
+            return
+
+        speculative = self.speculative
+        if (speculative is not None and speculative.key == key and speculative.lazy is not None
+                and not (speculative.isFinished() and speculative.timings is None)):
+            # Результат уже считается (или посчитан) заранее — остаётся его показать
+            self.speculative = None
+            self.adopt_translation(speculative)
+            return
+        self.discard_speculative()
+
         try:
-            # Создаем экземпляр Perevod
-            translator = Perevod(source_crs, target_crs, self.model)
-            
-            # Получаем результаты перевода
-            translated_coords = translator.from_source_to_target_crs()
-            
-            # Создаем модель для отображения результатов
-            result_model = PandasModel()
-            
-            # Подготавливаем данные для отображения
-            result_data = []
-            
-            # Определяем индексы нужных столбцов
-            lon_col = self.model.column_mapping['lon']
-            lat_col = self.model.column_mapping['lat']
-            name_col = self.model.column_mapping['name']
-            
-            if lon_col == -1 or lat_col == -1:
-                QMessageBox.warning(self, "Ошибка", "Не удалось определить столбцы с координатами")
-                return
-                
-            # Формируем заголовки
-            headers = []
-            if name_col != -1:
-                headers.append("Наименование")
-            headers.extend(["Долгота/X", "Широта/Y"])
-            
-            # Заполняем данные
-            for i, (orig_row, new_coords) in enumerate(zip(self.model._data, translated_coords)):
-                row_data = []
-                
-                # Добавляем наименование, если есть
-                if name_col != -1:
-                    row_data.append(orig_row[name_col])
-                    
-                # Добавляем только пересчитанные координаты
-                row_data.extend([
-                    str(new_coords[0]),
-                    str(new_coords[1])
-                ])
-                
-                result_data.append(row_data)
-            
-            # Устанавливаем данные в модель
-            result_model.setTableData(result_data, headers)
-            
-            # Отображаем модель в tableview_2
-            self.ui.tableView_2.setModel(result_model)
-            
-            # Настраиваем отображение таблицы
-            header = self.ui.tableView_2.horizontalHeader()
-            header.setSectionResizeMode(QHeaderView.Stretch)
-            header.setDefaultAlignment(Qt.AlignLeft)
-            
+            # Создаем экземпляр Perevod (СК определяются сразу, пересчёт — по блокам)
+            translator = Perevod(source_crs, target_crs, self.model, workers=None)
+            lazy = translator.lazy_result()
         except Exception as e:
             QMessageBox.warning(self, "Ошибка", f"Не удалось выполнить перевод координат: {str(e)}")
+            return
+        self.remember_pair(resolve_crs(source_crs), resolve_crs(target_crs))
 
-    def on_text_changed(self,lineedit:QLineEdit,listwidget:QListWidget):
-        """Обновление подсказок"""
-        text = lineedit.text().strip()
-        QTimer.singleShot(300, lambda: self.check_and_update_suggestions(text,listwidget))
+        # Таблица результата показывается сразу: видимые строки пересчитываются
+        # при отрисовке, остальные дозаполняются в фоновом потоке
+        name_col = self.model.column_mapping['name']
+        names = self.model.column(name_col) if name_col != -1 else None
+        result_model = ResultModel(lazy.out_x, lazy.out_y, lazy.valid, names,
+                                   self.result_decimals(), lazy)
+        self.show_result_model(result_model)
 
-    def check_and_update_suggestions(self, current_text:str,listwidget:QListWidget):
-        """Обновляет подсказки и скрывает список если текст совпадает с подсказкой"""
-        # Сначала проверяем совпадение с текущим текстом
-        if self.check_exact_match(current_text,listwidget):
-            listwidget.hide()
+        self.last_translation = None
+        self.dirty_rows.clear()
+        self.translation_worker = TranslationWorker(translator, lazy, self)
+        self.translation_worker.key = key
+        self.translation_worker.result_model = result_model
+        self.translation_worker.progress.connect(self.on_translation_progress)
+        self.translation_worker.result_ready.connect(self.on_translation_finished)
+        self.translation_worker.failed.connect(self.on_translation_failed)
+        self.translation_worker.finished.connect(self.on_translation_stopped)
+        self.set_translation_running(True)
+        self.translation_worker.start()
+
+    def adopt_translation(self, worker):
+        """Показывает результат заранее запущенного пересчёта и дальше ведёт его как обычный"""
+        lazy = worker.lazy
+        name_col = self.model.column_mapping['name']
+        names = self.model.column(name_col) if name_col != -1 else None
+        result_model = ResultModel(lazy.out_x, lazy.out_y, lazy.valid, names,
+                                   self.result_decimals(), lazy)
+        self.show_result_model(result_model)
+        self.remember_pair(resolve_crs(worker.source_crs), resolve_crs(worker.target_crs))
+
+        self.last_translation = None
+        self.dirty_rows.clear()
+        worker.result_model = result_model
+        self.translation_worker = worker
+        self.set_translation_running(True)
+        if worker.isFinished():
+            if worker.timings is not None:
+                self.on_translation_finished(worker.timings)
+            self.on_translation_stopped()
+
+    def prepare_translation(self):
+        """Как только выбраны обе СК: Transformer строится в фоне, а если данные
+        уже вставлены — заранее считается и результат"""
+        if self.translation_worker is not None:
             return
-            
-        # Если точного совпадения нет - обновляем подсказки
-        self.update_suggestions(current_text,listwidget)
+        source_crs = self.crs_from(self.ui.lineEdit)
+        target_crs = self.crs_from(self.ui.lineEdit_2)
+        if not isinstance(source_crs, tuple) or not isinstance(target_crs, tuple):
+            return
+        key = self.translation_key(source_crs, target_crs)
+        if self.speculative is not None and self.speculative.key == key:
+            return
+        self.discard_speculative()
 
-    def check_exact_match(self, text:str,listwidget:QListWidget):
-        """Проверяет точное совпадение текста с любой подсказкой"""
-        if not text:
-            return False
-            
-        for i in range(listwidget.count()):
-            if listwidget.item(i).text().lower() == text.lower():
-                return True
-        return False
+        mapping = self.model.column_mapping
+        if not self.model.rowCount() or mapping['lon'] == -1 or mapping['lat'] == -1:
+            self.start_prewarm([(source_crs[1], target_crs[1])])
+            return
+        worker = SpeculativeWorker(source_crs, target_crs, self.model, self)
+        worker.key = key
+        worker.progress.connect(self.on_speculative_progress)
+        worker.result_ready.connect(self.on_speculative_finished)
+        worker.failed.connect(self.on_speculative_failed)
+        worker.finished.connect(self.on_speculative_stopped)
+        self.background_workers.add(worker)
+        self.speculative = worker
+        worker.start()
+
+    def discard_speculative(self):
+        """Заранее начатый пересчёт больше не нужен (изменились данные или СК)"""
+        worker = self.speculative
+        if worker is None:
+            return
+        self.speculative = None
+        worker.requestInterruption()
+        if worker.isFinished():
+            self.background_workers.discard(worker)
+            worker.deleteLater()
+
+    # Сигналы заранее начатого пересчёта доходят до окна, только когда он
+    # стал обычным (нажата кнопка «Пересчитать»)
+    def on_speculative_progress(self, stage:str, done:int, total:int):
+        if self.sender() is self.translation_worker:
+            self.on_translation_progress(stage, done, total)
+
+    def on_speculative_finished(self, timings):
+        if self.sender() is self.translation_worker:
+            self.on_translation_finished(timings)
+
+    def on_speculative_failed(self, message:str):
+        if self.sender() is self.translation_worker:
+            self.on_translation_failed(message)
+
+    def on_speculative_stopped(self):
+        worker = self.sender()
+        self.background_workers.discard(worker)
+        if worker is self.translation_worker:
+            self.on_translation_stopped()
+        elif worker is not self.speculative:
+            worker.deleteLater()
+
+    def start_prewarm(self, pairs):
+        """Строит Transformer для пар СК в фоновом потоке"""
+        worker = PrewarmWorker(pairs, self)
+        worker.finished.connect(self.on_prewarm_stopped)
+        self.background_workers.add(worker)
+        worker.start()
+
+    def on_prewarm_stopped(self):
+        worker = self.sender()
+        self.background_workers.discard(worker)
+        worker.deleteLater()
+
+    def result_decimals(self):
+        value = self.decimals_box.value()
+        return None if value < 0 else value
 
-    def update_suggestions(self, current_text:str,listwidget:QListWidget):
-        """Обновление списка подсказок"""
-        listwidget.clear()
+    def on_decimals_changed(self):
+        result_model = self.ui.tableView_2.model()
+        if isinstance(result_model, ResultModel):
+            result_model.set_decimals(self.result_decimals())
+
+    def cancel_translation(self):
+        """Отмена текущего пересчёта"""
+        if self.translation_worker is not None:
+            self.translation_worker.requestInterruption()
+            self.translation_worker.cancelled = True
+            self.ui.statusbar.showMessage("Отмена пересчёта...")
+
+    def set_translation_running(self, running:bool):
+        """Блокирует изменение исходных данных на время пересчёта"""
+        self.ui.pushButton_4.setEnabled(not running)
+        self.ui.pushButton.setEnabled(not running)
+        self.ui.pushButton_3.setEnabled(not running)
+        self.cancel_button.setVisible(running)
+        self.ui.tableView.setEditTriggers(QTableView.NoEditTriggers if running else
+                                          QTableView.DoubleClicked | QTableView.EditKeyPressed)
+
+    def on_translation_progress(self, stage:str, done:int, total:int):
+        percent = done * 100 // total if total else 100
+        self.ui.statusbar.showMessage(f"{stage}: {percent}% ({done} из {total})")
+
+    def show_result_model(self, result_model):
+        # Отображаем модель в tableview_2 (подмена целиком, за один вызов)
+        self.ui.tableView_2.setModel(result_model)
         
-        if not current_text:
-            suggestions = self.word_dictionary
+        # Настраиваем отображение таблицы
+        header = self.ui.tableView_2.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        header.setDefaultAlignment(Qt.AlignLeft)
+
+    def on_translation_finished(self, timings):
+        key = self.translation_worker.key
+        if key == self.translation_key(key[0], key[1]):
+            # Пока шёл пересчёт, столбцы могли смениться — тогда дополнять результат нельзя
+            self.last_translation = {'key': key,
+                                     'translator': self.translation_worker.translator,
+                                     'model': self.translation_worker.result_model}
+
+        message = (f"Разбор: {timings['parse']:.3f} с, "
+                   f"пересчёт: {timings['transform']:.3f} с")
+        dedup_stats = self.translation_worker.lazy.dedup_stats
+        if dedup_stats:
+            message += f", уникальных точек: {dedup_stats['unique']} из {dedup_stats['rows']}"
+        bad_rows = self.translation_worker.translator.bad_rows
+        if bad_rows is not None and len(bad_rows):
+            message += (f", не распознаны числа в строках: "
+                        + ", ".join(str(row + 1) for row in bad_rows[:10])
+                        + (" ..." if len(bad_rows) > 10 else ""))
+        self.ui.statusbar.showMessage(message)
+
+    def on_translation_failed(self, message:str):
+        self.ui.statusbar.clearMessage()
+        QMessageBox.warning(self, "Ошибка", f"Не удалось выполнить перевод координат: {message}")
+
+    def on_translation_stopped(self):
+        if self.translation_worker.cancelled:
+            self.ui.statusbar.showMessage("Пересчёт отменён")
+        result_model = self.translation_worker.result_model
+        if self.last_translation is None or self.last_translation['model'] is not result_model:
+            # Пересчёт отменён или завершился ошибкой: правки исходной таблицы в эту
+            # модель больше не переносятся, поэтому наименования ей нужны свои
+            result_model.detach_names()
+        self.translation_worker.deleteLater()
+        self.translation_worker = None
+        self.set_translation_running(False)
+
+    def crs_from(self, lineedit:QLineEdit):
+        """СК из поля ввода: запись каталога (выбранная или с тем же именем) или слова текста"""
+        entry = self.selected_crs.get(lineedit)
+        if entry is not None and entry[0] == lineedit.text():
+            return entry
+        self.load_crs_catalog()
+        return self.crs_index.resolve(lineedit.text()) or lineedit.text().split()
+
+    def translation_key(self, source_crs, target_crs):
+        """Параметры пересчёта, при совпадении которых старый результат можно дополнять"""
+        mapping = self.model.column_mapping
+        return (tuple(source_crs), tuple(target_crs), mapping['name'], mapping['lon'], mapping['lat'])
+
+    def on_source_data_changed(self, top_left, bottom_right, roles=None):
+        self.discard_speculative()
+        if self.last_translation is None:
+            return
+        self.dirty_rows.update(range(top_left.row(), bottom_right.row() + 1))
+        self.incremental_timer.start()
+
+    def on_source_rows_inserted(self, parent, first, last):
+        self.discard_speculative()
+        if self.last_translation is None:
+            return
+        count = last - first + 1
+        self.dirty_rows = {row + count if row >= first else row for row in self.dirty_rows}
+        self.dirty_rows.update(range(first, last + 1))
+        # Держим таблицу результата строка в строку с исходной
+        self.last_translation['model'].insert_rows(first, count)
+        self.incremental_timer.start()
+
+    def on_source_rows_removed(self, parent, first, last):
+        self.discard_speculative()
+        if self.last_translation is None:
+            return
+        count = last - first + 1
+        self.dirty_rows = {row - count if row > last else row
+                           for row in self.dirty_rows if not first <= row <= last}
+        result_model = self.last_translation['model']
+        for row in range(last, first - 1, -1):
+            result_model.removeRow(row)
+
+    def on_source_reset(self):
+        """Данные или столбцы заменены целиком — старый результат дополнять нельзя"""
+        self.discard_speculative()
+        self.last_translation = None
+        self.dirty_rows.clear()
+        # Столбцы модели могут остаться теми же объектами (смена заголовков),
+        # а правки в показанный результат больше не переносятся
+        result_model = self.ui.tableView_2.model()
+        if isinstance(result_model, ResultModel):
+            result_model.detach_names()
+
+    def apply_incremental(self):
+        """Пересчитывает только изменённые строки и обновляет их в tableview_2"""
+        if self.last_translation is None or not self.dirty_rows:
+            return
+        rows = sorted(self.dirty_rows)
+        self.dirty_rows.clear()
+        try:
+            out_x, out_y, valid = self.last_translation['translator'].transform_rows(rows)
+        except Exception as e:
+            QMessageBox.warning(self, "Ошибка", f"Не удалось выполнить перевод координат: {str(e)}")
+            return
+
+        self.last_translation['model'].update_rows(rows, out_x, out_y, valid)
+        self.ui.statusbar.showMessage(f"Пересчитано изменённых строк: {len(rows)}")
+
+    def on_text_changed(self,lineedit:QLineEdit,listwidget:QListView):
+        """Обновление подсказок: таймер перезапускается, поиск идёт после паузы в наборе"""
+        entry = self.selected_crs.get(lineedit)
+        if entry is None or entry[0] != lineedit.text():
+            # СК введена вручную — заранее начатый пересчёт для прежней пары не пригодится
+            self.discard_speculative()
+        self.search_timers[listwidget].start()
+
+    def start_search(self, lineedit:QLineEdit, listwidget:QListView):
+        """Запускает поиск подсказок в фоновом потоке"""
+        self.load_crs_catalog()
+        generation = self.search_generation.get(listwidget, 0) + 1
+        self.search_generation[listwidget] = generation
+        worker = SearchWorker(self.crs_index, lineedit.text().strip(),
+                              list(self.recent_crs[listwidget]),
+                              self.crs_filter, CrsFilterProxy.PAGE, self)
+        worker.listwidget = listwidget
+        worker.generation = generation
+        worker.found.connect(self.on_search_finished)
+        worker.finished.connect(lambda: self.on_search_stopped(worker))
+        self.search_workers.add(worker)
+        worker.start()
+
+    def on_crs_filter_changed(self):
+        """Пересобирает маску фильтров и сразу обновляет оба списка подсказок"""
+        self.load_crs_catalog()
+        self.crs_filter = self.crs_facets.mask(self.kind_box.currentData(),
+                                               self.datum_box.currentData(),
+                                               self.region_box.currentData())
+        for lineedit, listwidget in ((self.ui.lineEdit, self.ui.listWidget),
+                                     (self.ui.lineEdit_2, self.ui.listWidget_2)):
+            self.search_timers[listwidget].stop()
+            self.start_search(lineedit, listwidget)
+
+    def on_search_finished(self, worker):
+        """Показывает найденные подсказки, если за это время не начат более новый поиск"""
+        listwidget = worker.listwidget
+        if worker.generation != self.search_generation[listwidget]:
+            return
+        if worker.exact:
+            listwidget.hide()
+            return
+        proxy = listwidget.model()
+        proxy.set_result(worker.result)
+        if proxy.rowCount():
+            listwidget.show()
         else:
-            suggestions = [
-                word for word in self.word_dictionary 
-                if str(current_text).lower() in str(word).lower()
-            ]
-        
-        if suggestions:
-            for word in suggestions:
-                listwidget.addItem(str(word))
+            listwidget.hide()
+
+    def on_search_stopped(self, worker):
+        self.search_workers.discard(worker)
+        worker.deleteLater()
+
+    def load_crs_catalog(self):
+        """Загружает каталог СК: одна общая модель, у каждого списка свой фильтр"""
+        if self.crs_index is not None:
+            return
+        self.crs_index = catalog.index
+        self.crs_facets = catalog.facets
+        self.datum_box.blockSignals(True)
+        for family in self.crs_facets.datum_families():
+            self.datum_box.addItem(family, family)
+        self.datum_box.blockSignals(False)
+        self.crs_model = CrsListModel(self.crs_index.words, self)
+        for source, target in reversed(self.recent_pairs):
+            self.remember_crs(self.ui.listWidget, self.crs_index.row_of(source[0]))
+            self.remember_crs(self.ui.listWidget_2, self.crs_index.row_of(target[0]))
+        for listview in (self.ui.listWidget, self.ui.listWidget_2):
+            listview.setModel(CrsFilterProxy(self.crs_model, listview))
+            #При инициации приложения отображение перечня
+            self.update_suggestions("", listview)
+        #Индекс подстрок строится сразу, до первого запроса
+        self.crs_index.postings
+
+        #Transformer для частых пар строится в фоне, первый пересчёт не ждёт базу PROJ
+        pairs = [(source[1], target[1]) for source, target in self.recent_pairs[:PREWARM_PAIRS]]
+        if pairs:
+            self.start_prewarm(pairs)
+
+    def update_suggestions(self, current_text:str,listwidget:QListView):
+        """Обновление списка подсказок: меняется только фильтр, элементы не пересоздаются"""
+        self.load_crs_catalog()
+        proxy = listwidget.model()
+        proxy.set_result(self.crs_index.ranked(current_text, self.recent_crs[listwidget],
+                                               self.crs_filter))
+        
+        if proxy.rowCount():
             listwidget.show()
         else:
             listwidget.hide()
 
-    def apply_suggestion(self,item, lineedit:QLineEdit,listwidget:QListWidget):
+    def apply_suggestion(self,index, lineedit:QLineEdit,listwidget:QListView):
         """Применяет выбранную подсказку"""     
-        lineedit.setText(item.text())
+        row = listwidget.model().mapToSource(index).row()
+        self.selected_crs[lineedit] = self.crs_index.entry(row)
+        self.remember_crs(listwidget, row)
+        lineedit.setText(index.data())
         listwidget.hide()
         lineedit.setFocus()
+        self.prepare_translation()
     
+    def remember_crs(self, listwidget:QListView, row):
+        """Запоминает запись как недавно использованную в этом списке"""
+        if row is None:
+            return
+        recent = self.recent_crs[listwidget]
+        if row in recent:
+            recent.remove(row)
+        recent.insert(0, row)
+        del recent[RECENT_CRS_LIMIT:]
+
+    def load_recent_pairs(self):
+        """Пары СК прошлых запусков: [[имя, код] исходной, [имя, код] целевой]"""
+        try:
+            pairs = json.loads(app_settings().value("recent_pairs", "[]"))
+        except (TypeError, ValueError):
+            return []
+        if not isinstance(pairs, list):
+            return []
+        # Настройки могли быть испорчены: оставляем только пары вида [[str, int], [str, int]]
+        return [pair for pair in pairs
+                if isinstance(pair, list) and len(pair) == 2 and all(map(is_crs_entry, pair))]
+
+    def remember_pair(self, source, target):
+        """Запоминает пару СК пересчёта и сохраняет список пар в настройках"""
+        pair = [list(source), list(target)]
+        if pair in self.recent_pairs:
+            self.recent_pairs.remove(pair)
+        self.recent_pairs.insert(0, pair)
+        del self.recent_pairs[RECENT_PAIRS_LIMIT:]
+        app_settings().setValue("recent_pairs", json.dumps(self.recent_pairs, ensure_ascii=False))
+        if self.crs_index is not None:
+            self.remember_crs(self.ui.listWidget, self.crs_index.row_of(source[0]))
+            self.remember_crs(self.ui.listWidget_2, self.crs_index.row_of(target[0]))
+
+    def closeEvent(self, event):
+        # Поиск подсказок короткий, дожидаемся его, чтобы потоки не уничтожались на ходу
+        for worker in list(self.search_workers):
+            worker.wait()
+        for worker in list(self.background_workers):
+            worker.requestInterruption()
+            worker.wait()
+        if self.translation_worker is not None:
+            # fill проверяет прерывание между частями, так что ждать недолго
+            self.translation_worker.cancelled = True
+            self.translation_worker.requestInterruption()
+            self.translation_worker.wait()
+        super().closeEvent(event)
+
     def keyPressEvent(self, event):
+        if self.translation_worker is not None and event.key() in (Qt.Key_V, Qt.Key_Delete):
+            # Пока идёт пересчёт, исходные данные не меняем
+            return
         if event.key() == Qt.Key_V and event.modifiers() == Qt.ControlModifier:
             self.paste_from_clipboard()
         elif event.key() == Qt.Key_Delete:
@@ -359,7 +786,6 @@ class MainWindow(QMainWindow):
             dialog = ColumnMappingDialog(data[0] if data else [], self)
             if dialog.exec() == QDialog.Accepted:
                 mapping = dialog.get_mapping()
-                self.model.set_column_mapping(mapping)
                 
                 # Устанавливаем данные в модель
                 headers = [f"Столбец {i+1}" for i in range(len(data[0]))]
@@ -372,7 +798,8 @@ class MainWindow(QMainWindow):
                 if mapping['lat'] != -1:
                     headers[mapping['lat']] = "Широта/Y"
                 
-                self.model.setTableData(data, headers)
+                # Сопоставление передаём вместе с данными, чтобы столбцы сразу получили нужное хранение
+                self.model.setTableData(data, headers, mapping)
 
                 #Растягивание таблиц, чтоб красиво было
                 header = self.ui.tableView.horizontalHeader()
@@ -383,7 +810,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Ошибка", f"Не удалось вставить данные: {str(e)}")
 
     def copy_to_clipboard(self):
-        if not self.model._data:
+        if not self.model.rowCount():
             return
             
         clipboard = QApplication.clipboard()
@@ -393,8 +820,8 @@ class MainWindow(QMainWindow):
         text += "\t".join(str(header) for header in self.model._headers) + "\n"
         
         # Добавляем данные
-        for row in self.model._data:
-            text += "\t".join(str(cell) for cell in row) + "\n"
+        for row in range(self.model.rowCount()):
+            text += "\t".join(str(cell) for cell in self.model.row_values(row)) + "\n"
         
         clipboard.setText(text.strip())
         QMessageBox.information(self, "Успех", "Таблица скопирована в буфер обмена")
@@ -408,6 +835,183 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Успех", 
                                   "Названия столбцов 'Широта/Y' и 'Долгота/X' успешно поменялись местами")
 
+class CrsListModel(QAbstractListModel):
+    """Общая модель перечня СК из словаря"""
+    def __init__(self, words, parent=None):
+        super().__init__(parent)
+        self.words = words
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.words)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return str(self.words[index.row()])
+        return None
+
+class CrsFilterProxy(QAbstractProxyModel):
+    """Фильтр перечня СК для одного списка.
+
+    Хранит только номера подходящих строк общей модели, поэтому смена
+    фильтра не создаёт и не удаляет элементы списка. Ранжированный результат
+    показывается страницами: следующая подгружается при прокрутке до конца
+    """
+    #Сколько подсказок добавляется за одну подгрузку
+    PAGE = 50
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._positions = None
+        self._result = None
+        self.setSourceModel(source)
+
+    def set_result(self, result):
+        """Показывает первую страницу ранжированного результата поиска"""
+        self._result = result
+        self.set_rows(result.top(self.PAGE))
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return (not parent.isValid() and self._result is not None
+                and len(self._rows) < len(self._result))
+
+    def fetchMore(self, parent=QModelIndex()):
+        rows = self._result.top(len(self._rows) + self.PAGE)
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(rows) - 1)
+        self._rows = rows
+        self._positions = None
+        self.endInsertRows()
+
+    def set_rows(self, rows):
+        """Задаёт номера видимых строк общей модели (в порядке отображения)"""
+        self.beginResetModel()
+        self._rows = rows
+        self._positions = None
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not 0 <= row < len(self._rows) or column != 0:
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], 0)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._positions is None:
+            self._positions = {row: i for i, row in enumerate(self._rows)}
+        position = self._positions.get(source_index.row())
+        return QModelIndex() if position is None else self.index(position, 0)
+
+class PrewarmWorker(QThread):
+    """Заранее строит Transformer для пар СК и кладёт их в общий кэш"""
+    def __init__(self, pairs, parent=None):
+        super().__init__(parent)
+        self.pairs = pairs
+
+    def run(self):
+        for source_crs, target_crs in self.pairs:
+            if self.isInterruptionRequested():
+                return
+            try:
+                get_transformer(source_crs, target_crs)
+            except (CRSError, ProjError):
+                # Пара могла пропасть из базы PROJ после обновления — пропускаем
+                pass
+
+class SearchWorker(QThread):
+    """Поиск подсказок СК в фоновом потоке: первая страница ранжируется здесь же"""
+    found = Signal(object)
+
+    def __init__(self, index, text, recent, allowed, page, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.text = text
+        self.recent = recent
+        self.allowed = allowed
+        self.page = page
+        self.result = None
+        self.exact = False
+
+    def run(self):
+        self.result = self.index.ranked(self.text, self.recent, self.allowed)
+        self.result.top(self.page)
+        self.exact = bool(self.text) and self.index.is_exact(self.text)
+        self.found.emit(self)
+
+class TranslationWorker(QThread):
+    """Фоновое дозаполнение результата пересчёта"""
+    progress = Signal(str, int, int)
+    result_ready = Signal(object)
+    failed = Signal(str)
+
+    #Минимальный интервал между сообщениями о прогрессе, с
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, translator, lazy, parent=None):
+        super().__init__(parent)
+        self.translator = translator
+        self.lazy = lazy
+        self.cancelled = False
+        self.timings = None
+        self._last_progress = 0
+
+    def report(self, stage:str, done:int, total:int):
+        """Отправляет прогресс не чаще PROGRESS_INTERVAL (и всегда по завершении этапа)"""
+        now = time.monotonic()
+        if done == total or now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.progress.emit(stage, done, total)
+
+    def run(self):
+        try:
+            start = time.perf_counter()
+            if not self.lazy.fill(
+                    progress=lambda done, total: self.report("Пересчёт", done, total),
+                    is_cancelled=self.isInterruptionRequested):
+                return
+            self.translator.timings['transform'] = time.perf_counter() - start
+            self.timings = dict(self.translator.timings)
+            self.result_ready.emit(self.timings)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+class SpeculativeWorker(TranslationWorker):
+    """Пересчёт до нажатия «Пересчитать»: задание и Transformer тоже создаются в фоне"""
+    def __init__(self, source_crs, target_crs, model, parent=None):
+        super().__init__(None, None, parent)
+        self.source_crs = source_crs
+        self.target_crs = target_crs
+        self.model = model
+
+    def run(self):
+        try:
+            translator = Perevod(self.source_crs, self.target_crs, self.model, workers=None)
+            lazy = translator.lazy_result()
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        if self.isInterruptionRequested():
+            return
+        self.translator = translator
+        self.lazy = lazy
+        super().run()
+
 class ColumnMappingDialog(QDialog):
     def __init__(self, columns, parent=None):
         super().__init__(parent)
@@ -461,24 +1065,33 @@ class ColumnMappingDialog(QDialog):
         }
 
 class PandasModel(QAbstractTableModel):
+    """Табличная модель с хранением по столбцам.
+
+    Столбцы координат хранятся массивами float64, наименования — кодами
+    с общим списком значений, остальные — списками строк. Текст для
+    отображения и редактирования формируется в data() по запросу
+    """
     def __init__(self, data=None):
         super().__init__()
-        self._data = data if data is not None else []
+        self._columns = []
+        self._row_count = 0
         self._headers = []
         self.column_mapping = {'name': -1, 'lon': -1, 'lat': -1}
+        if data:
+            self._set_columns(data)
 
     def rowCount(self, parent=None):
-        return len(self._data)
+        return self._row_count
 
     def columnCount(self, parent=None):
-        return len(self._data[0]) if self._data else 0
+        return len(self._columns)
 
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return None
             
         if role == Qt.DisplayRole or role == Qt.EditRole:
-            return str(self._data[index.row()][index.column()])
+            return str(self._columns[index.column()].get(index.row()))
         return None
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
@@ -486,17 +1099,6 @@ class PandasModel(QAbstractTableModel):
             return self._headers[section] if section < len(self._headers) else None
         return None
 
-    def setData(self, index, value, role=Qt.EditRole):
-        if role == Qt.EditRole and index.isValid():
-            try:
-                self._data[index.row()][index.column()] = value
-                self.dataChanged.emit(index, index)
-                return True
-            except Exception as e:
-                print(f"Error setting data: {e}")
-                return False
-        return False
-
     def flags(self, index):
         if not index.isValid():
             return Qt.NoItemFlags
@@ -506,7 +1108,7 @@ class PandasModel(QAbstractTableModel):
         """Метод для редактирования ячеек (оставляем с оригинальным именем)"""
         if role == Qt.EditRole and index.isValid():
             try:
-                self._data[index.row()][index.column()] = value
+                self._columns[index.column()].set(index.row(), value)
                 self.dataChanged.emit(index, index)
                 return True
             except Exception as e:
@@ -514,15 +1116,55 @@ class PandasModel(QAbstractTableModel):
                 return False
         return False
 
-    def setTableData(self, data, headers=None):
+    def column_kind(self, col):
+        """Тип хранения столбца по сопоставлению столбцов"""
+        if col in (self.column_mapping['lon'], self.column_mapping['lat']):
+            return 'float'
+        if col == self.column_mapping['name']:
+            return 'category'
+        return 'text'
+
+    def _set_columns(self, data):
+        width = len(data[0]) if data else 0
+        self._columns = [make_column(extract_column(data, col), self.column_kind(col))
+                         for col in range(width)]
+        self._row_count = len(data) if width else 0
+
+    def setTableData(self, data, headers=None, mapping=None):
         """Метод для установки данных таблицы (переименован из setData)"""
         self.beginResetModel()
-        self._data = data
+        if mapping is not None:
+            self.column_mapping = mapping
+        self._set_columns(data)
         self._headers = headers if headers is not None else [f"Столбец {i+1}" for i in range(len(data[0]))] if data else []
         self.endResetModel()
 
     def set_column_mapping(self, mapping):
         self.column_mapping = mapping
+        # Переводим столбцы, у которых сменилась роль, в подходящее хранение
+        changed = [col for col, column in enumerate(self._columns)
+                   if column.kind != self.column_kind(col)]
+        if changed:
+            self.beginResetModel()
+            for col in changed:
+                self._columns[col] = make_column(self._columns[col].texts(), self.column_kind(col))
+            self.endResetModel()
+
+    def numeric_column(self, col, rows=None):
+        """Значения столбца в float64 и маска корректных ячеек (для столбцов координат без разбора)"""
+        column = self._columns[col]
+        if column.kind == 'float':
+            return column.numeric(rows)
+        values, valid, _ = parse_column(column.texts(rows))
+        return values, valid
+
+    def column(self, col):
+        """Объект хранения столбца"""
+        return self._columns[col]
+
+    def row_values(self, row):
+        """Текст ячеек строки"""
+        return [column.get(row) for column in self._columns]
         
     def swap_lat_lon_headers(self):
         lat_col = self.column_mapping['lat']
@@ -540,11 +1182,21 @@ class PandasModel(QAbstractTableModel):
         
         return True
     
+    def insert_rows(self, position, rows):
+        """Вставляет строки в указанную позицию"""
+        self.beginInsertRows(QModelIndex(), position, position + len(rows) - 1)
+        for col, column in enumerate(self._columns):
+            column.insert(position, extract_column(rows, col))
+        self._row_count += len(rows)
+        self.endInsertRows()
+
     def removeRow(self, row, parent=QModelIndex()):
         """Удаляет строку из модели"""
-        if 0 <= row < len(self._data):
+        if 0 <= row < self._row_count:
             self.beginRemoveRows(parent, row, row)
-            del self._data[row]
+            for column in self._columns:
+                column.delete(row)
+            self._row_count -= 1
             self.endRemoveRows()
             return True
         return False
@@ -559,58 +1211,131 @@ class PandasModel(QAbstractTableModel):
             self.removeRow(row)
         return True
 
-class Perevod(QAbstractTableModel):
-    def __init__(self, source_crs, target_crs, model, parent = None):
-        super().__init__(parent)
-        numbers = "0123456789"
-        self.crs_name = " ".join(source_crs)
-        self.source_crs = int("".join([i for i in source_crs[-1] if i in numbers]))
-        self.target_crs = int("".join([i for i in target_crs[-1] if i in numbers]))
-        self.model = model._data
-        self.headers = model._headers
-        self.from_source_to_target_crs()
-        
-        
-    def from_source_to_target_crs(self):
-        lst = []    
-        transformer = Transformer.from_crs(self.source_crs, self.target_crs)
-        hantos_fields = {
-            "UTM Геонац 42N (Приобское) (32642)":[69.204, 50.538],
-            "UTM Геонац 42N (Зимнее) (32642)":[68.885, 51.173],
-            "UTM Геонац 42N (Красноленинское) (32642)":[70.117, 50.83],
-            "UTM Геонац 43N (Мало-Юганское) (32643)":[56.005, 43.855],
-            "UTM Геонац 43N (Орехово-Ермаковское) (32643)":[56.237, 43.463]
-        }
-        popravka_1 = 0
-        popravka_2 = 0
-        
-        for i in hantos_fields:
-            if self.crs_name == i:
-                popravka_1 = hantos_fields[i][0]
-                popravka_2 = hantos_fields[i][1]
-            
-        # Находим индексы столбцов с координатами
-        for x, y in enumerate(self.headers):
-            if y == "Долгота/X":
-                long = x
-            if y == "Широта/Y":
-                lat = x
-        
-        for i in self.model:
-            try:
-                # Преобразуем координаты, заменяя запятые на точки для корректного преобразования в float
-                tmp = transformer.transform(
-                    float(i[lat].replace(",", ".")) - popravka_1, 
-                    float(i[long].replace(",", ".")) - popravka_2
-                )
-                lst.append(tmp)
-            except Exception as e:
-                print(f"Ошибка преобразования координат: {e}")
-                lst.append(("Ошибка", "Ошибка"))
-        
-        return lst
-        
+class ResultModel(QAbstractTableModel):
+    """Модель результата пересчёта поверх массивов float64.
+
+    Наименования берутся по ссылке из столбца исходной таблицы, текст
+    координат формируется в data() только для отображаемых ячеек
+    """
+    def __init__(self, out_x, out_y, valid, names=None, decimals=None, lazy=None):
+        super().__init__()
+        self.out_x = out_x
+        self.out_y = out_y
+        self.valid = valid
+        self.names = names
+        self.decimals = decimals
+        self.lazy = lazy
+        self._headers = (["Наименование"] if names is not None else []) + ["Долгота/X", "Широта/Y"]
+        self._edited = {}
+
+    def rowCount(self, parent=None):
+        return len(self.out_x)
+
+    def columnCount(self, parent=None):
+        return len(self._headers)
+
+    def format_value(self, value):
+        if self.decimals is None:
+            return str(value)
+        return f"{value:.{self.decimals}f}"
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            row, col = index.row(), index.column()
+            edited = self._edited.get(row)
+            if edited and col in edited:
+                return edited[col]
+            if self.names is not None:
+                if col == 0:
+                    return str(self.names.get(row))
+                col -= 1
+            if self.lazy is not None:
+                # Строка ещё не пересчитана фоновым потоком — считаем её блок сейчас
+                self.lazy.ensure(row)
+            if not self.valid[row]:
+                return "Ошибка"
+            return self.format_value(float(self.out_x[row] if col == 0 else self.out_y[row]))
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return super().flags(index) | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Правка ячейки результата хранится поверх пересчитанных значений"""
+        if role == Qt.EditRole and index.isValid():
+            self._edited.setdefault(index.row(), {})[index.column()] = value
+            self.dataChanged.emit(index, index)
+            return True
+        return False
+
+    def set_decimals(self, decimals):
+        self.decimals = decimals
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(self.rowCount() - 1, self.columnCount() - 1))
+
+    def detach_lazy(self):
+        """Досчитывает оставшиеся блоки; дальше модель работает только со своими массивами"""
+        if self.lazy is not None:
+            self.lazy.fill()
+            self.lazy = None
+
+    def detach_names(self):
+        """Копирует наименования из исходной таблицы, дальше модель от неё не зависит"""
+        if self.names is not None:
+            self.names = make_column(self.names.texts(), 'text')
+
+    def insert_rows(self, position, count):
+        """Вставляет пустые (ещё не пересчитанные) строки"""
+        self.detach_lazy()
+        self.beginInsertRows(QModelIndex(), position, position + count - 1)
+        self.out_x = np.insert(self.out_x, position, np.full(count, np.nan))
+        self.out_y = np.insert(self.out_y, position, np.full(count, np.nan))
+        self.valid = np.insert(self.valid, position, np.zeros(count, dtype=bool))
+        self._edited = {(row + count if row >= position else row): cells
+                        for row, cells in self._edited.items()}
+        self.endInsertRows()
+
+    def update_rows(self, rows, out_x, out_y, valid):
+        """Записывает пересчитанные значения строк и оповещает представление одним сигналом"""
+        if not len(rows):
+            return
+        self.detach_lazy()
+        rows = np.asarray(rows, dtype=np.intp)
+        self.out_x[rows] = out_x
+        self.out_y[rows] = out_y
+        self.valid[rows] = valid
+        for row in rows.tolist():
+            self._edited.pop(row, None)
+        self.dataChanged.emit(self.index(int(rows.min()), 0),
+                              self.index(int(rows.max()), self.columnCount() - 1))
+
+    def removeRow(self, row, parent=QModelIndex()):
+        """Удаляет строку из модели"""
+        if 0 <= row < self.rowCount():
+            self.detach_lazy()
+            self.beginRemoveRows(parent, row, row)
+            self.out_x = np.delete(self.out_x, row)
+            self.out_y = np.delete(self.out_y, row)
+            self.valid = np.delete(self.valid, row)
+            self._edited = {(r - 1 if r > row else r): cells
+                            for r, cells in self._edited.items() if r != row}
+            self.endRemoveRows()
+            return True
+        return False
+
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = QApplication([])
     window = MainWindow()
     window.show()
@@ -0,0 +1,153 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from batch import transform_arrays, transform_in_chunks
+from transformer_cache import get_transformer
+
+#Меньше этого числа точек пул процессов не окупается
+PARALLEL_MIN_POINTS = 1_000_000
+#Размер пробной части для подбора размера частей
+PROBE_POINTS = 20_000
+#Желаемое время обработки одной части в процессе, с
+TARGET_CHUNK_SECONDS = 0.25
+MIN_CHUNKSIZE = 50_000
+
+def default_workers():
+    return max(1, (os.cpu_count() or 1) - 1)
+
+def _shared_views(buf, n):
+    """Массивы поверх общего блока памяти: входные x, y, маска и выходные x, y, маска"""
+    floats = np.ndarray((4, n), dtype=np.float64, buffer=buf)
+    masks = np.ndarray((2, n), dtype=bool, buffer=buf, offset=floats.nbytes)
+    return floats[0], floats[1], masks[0], floats[2], floats[3], masks[1]
+
+def _close(shm):
+    """Закрывает блок; при исключении массивы-представления могут ещё жить в трассировке"""
+    try:
+        shm.close()
+    except BufferError:
+        pass
+
+def _transform_chunk(source_crs, target_crs, options, shm_name, n, lo, hi):
+    """Выполняется в процессе пула: свой Transformer из кэша процесса.
+
+    Между процессами передаётся только описание части (имя блока и границы),
+    координаты читаются и записываются прямо в общей памяти
+    """
+    transformer = get_transformer(source_crs, target_crs, **options)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        xx, yy, valid, out_x, out_y, out_valid = _shared_views(shm.buf, n)
+        out_x[lo:hi], out_y[lo:hi], out_valid[lo:hi] = transform_arrays(
+            transformer, xx[lo:hi], yy[lo:hi], valid[lo:hi])
+        del xx, yy, valid, out_x, out_y, out_valid
+    finally:
+        _close(shm)
+    return hi - lo
+
+def auto_chunksize(n, workers, points_per_second):
+    """Подбирает размер части по измеренной скорости пересчёта.
+
+    Часть должна обрабатываться около TARGET_CHUNK_SECONDS, но частей должно
+    быть не меньше, чем по две на процесс, чтобы нагрузка распределялась ровно
+    """
+    by_time = int(points_per_second * TARGET_CHUNK_SECONDS)
+    by_balance = -(-n // (workers * 2))
+    return max(MIN_CHUNKSIZE, min(by_time, by_balance))
+
+class ParallelTransform:
+    """Пересчёт больших массивов координат пулом процессов.
+
+    Массивы делятся на части, каждый процесс берёт Transformer для пары СК
+    из своего кэша, результаты собираются в исходном порядке строк
+    """
+    def __init__(self, source_crs, target_crs, workers=None, chunksize=None, **options):
+        self.source_crs = source_crs
+        self.target_crs = target_crs
+        self.options = options
+        self.workers = workers or default_workers()
+        self.chunksize = chunksize
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def transform(self, xx, yy, valid=None, progress=None, is_cancelled=None):
+        """Пересчитывает массивы; небольшие объёмы считаются в текущем процессе.
+
+        progress(done, total) вызывается по мере готовности частей, при
+        is_cancelled() == True оставшиеся части снимаются и возвращается None
+        """
+        xx = np.ascontiguousarray(xx, dtype=np.float64)
+        yy = np.ascontiguousarray(yy, dtype=np.float64)
+        if valid is None:
+            valid = ~(np.isnan(xx) | np.isnan(yy))
+        n = len(xx)
+        transformer = get_transformer(self.source_crs, self.target_crs, **self.options)
+        if self.workers <= 1 or n < PARALLEL_MIN_POINTS:
+            if progress is None and is_cancelled is None:
+                return transform_arrays(transformer, xx, yy, valid)
+            return transform_in_chunks(transformer, xx, yy, valid, progress, is_cancelled)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(n * (4 * 8 + 2), 1))
+        try:
+            views = _shared_views(shm.buf, n)
+            in_x, in_y, in_valid, out_x, out_y, out_valid = views
+            in_x[:], in_y[:], in_valid[:] = xx, yy, valid
+
+            # Пробная часть считается здесь же и служит для подбора размера частей
+            start = 0
+            chunksize = self.chunksize
+            if chunksize is None:
+                probe = min(PROBE_POINTS, n)
+                t = time.perf_counter()
+                out_x[:probe], out_y[:probe], out_valid[:probe] = transform_arrays(
+                    transformer, xx[:probe], yy[:probe], valid[:probe])
+                rate = probe / max(time.perf_counter() - t, 1e-6)
+                chunksize = auto_chunksize(n - probe, self.workers, rate)
+                start = probe
+
+            futures = [self.pool.submit(_transform_chunk, self.source_crs, self.target_crs,
+                                        self.options, shm.name, n, lo, min(lo + chunksize, n))
+                       for lo in range(start, n, chunksize)]
+            done = start
+            for future in as_completed(futures):
+                if is_cancelled is not None and is_cancelled():
+                    for pending in futures:
+                        pending.cancel()
+                    wait(futures)
+                    return None
+                done += future.result()
+                if progress is not None:
+                    progress(done, n)
+
+            result = out_x.copy(), out_y.copy(), out_valid.copy()
+            del views, in_x, in_y, in_valid, out_x, out_y, out_valid
+            return result
+        finally:
+            _close(shm)
+            shm.unlink()
+
+def transform_parallel(source_crs, target_crs, xx, yy, valid=None, workers=None, chunksize=None,
+                       progress=None, is_cancelled=None):
+    """Разовый параллельный пересчёт массивов координат"""
+    with ParallelTransform(source_crs, target_crs, workers, chunksize) as parallel:
+        return parallel.transform(xx, yy, valid, progress, is_cancelled)
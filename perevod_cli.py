@@ -0,0 +1,133 @@
+"""Пакетный перевод координат из файла без графического интерфейса.
+
+Пример:
+    python perevod_cli.py coords.txt output.csv -s "UTM Геонац 42N (Приобское) (32642)" -t 4326
+"""
+import argparse
+import itertools
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from batch import get_popravki, parse_column, resolve_crs, transform_unique
+from crs_catalog import catalog
+from parallel import PARALLEL_MIN_POINTS, ParallelTransform
+from transformer_cache import transformer_cache
+
+def find_crs(text:str):
+    """Находит СК по полному имени из словаря, коду EPSG или однозначной части имени"""
+    text = " ".join(text.split())
+    if text.isdigit():
+        return resolve_crs([text])
+
+    index = catalog.index
+    entry = index.resolve(text)
+    if entry is not None:
+        return entry
+
+    matches = index.search(text)
+    if len(matches) == 1:
+        return index.entry(matches[0])
+    if not matches:
+        raise ValueError(f"СК '{text}' не найдена в словаре")
+    raise ValueError(f"СК '{text}' неоднозначна, подходят: "
+                     + "; ".join(index.words[i] for i in matches[:10]))
+
+def read_chunks(input_path, sep, header, chunksize):
+    """Читает входной файл частями фиксированного размера (все ячейки как строки)"""
+    if sep is None:
+        sep = "," if input_path.lower().endswith(".csv") else r"\s+"
+    return pd.read_csv(input_path, sep=sep, header=0 if header else None,
+                       dtype=str, keep_default_na=False, chunksize=chunksize)
+
+def check_columns(chunk, columns):
+    """Проверяет, что номера столбцов {параметр: номер} есть во входном файле"""
+    count = chunk.shape[1]
+    for option, col in columns.items():
+        if col is not None and not 0 <= col < count:
+            raise ValueError(f"Столбца {col} ({option}) нет во входном файле, "
+                             f"столбцов в нём: {count}")
+
+def convert_chunk(chunk, parallel, popravki, lon_col, lat_col, name_col=None):
+    """Пересчитывает одну часть файла и формирует таблицу результата"""
+    xx, valid_x, _ = parse_column(chunk.iloc[:, lat_col].to_numpy())
+    yy, valid_y, _ = parse_column(chunk.iloc[:, lon_col].to_numpy())
+    out_x, out_y, valid, unique = transform_unique(xx - popravki[0], yy - popravki[1],
+                                                   valid_x & valid_y, parallel.transform)
+
+    result = {}
+    if name_col is not None:
+        result["Наименование"] = chunk.iloc[:, name_col].to_numpy()
+    result["Долгота/X"] = np.where(valid, out_x, np.nan)
+    result["Широта/Y"] = np.where(valid, out_y, np.nan)
+    return pd.DataFrame(result), int((~valid).sum()), unique
+
+def convert_file(input_path, output_path, source, target, lon_col=0, lat_col=1,
+                 name_col=None, sep=None, out_sep=",", header=False, chunksize=100_000,
+                 workers=1):
+    """Потоково пересчитывает файл, записывая результат по мере обработки частей"""
+    crs_name, source_crs = find_crs(source)
+    _, target_crs = find_crs(target)
+    popravki = get_popravki(crs_name)
+    if workers != 1:
+        # Части файла должны быть достаточно крупными, чтобы пул процессов окупался
+        chunksize = max(chunksize, PARALLEL_MIN_POINTS)
+
+    # Номера столбцов проверяются по первой части, до того как выходной файл перезаписан
+    chunks = read_chunks(input_path, sep, header, chunksize)
+    first = next(chunks, None)
+    if first is not None:
+        check_columns(first, {"--lon-col": lon_col, "--lat-col": lat_col, "--name-col": name_col})
+
+    rows = errors = unique = 0
+    with open(output_path, "w", encoding="utf-8-sig", newline="") as output, \
+            ParallelTransform(source_crs, target_crs, workers) as parallel:
+        for i, chunk in enumerate(itertools.chain([first] if first is not None else [], chunks)):
+            result, chunk_errors, chunk_unique = convert_chunk(chunk, parallel, popravki,
+                                                 lon_col, lat_col, name_col)
+            result.to_csv(output, sep=out_sep, index=False, header=(i == 0),
+                          na_rep="Ошибка")
+            rows += len(result)
+            errors += chunk_errors
+            unique += chunk_unique
+    return rows, errors, unique
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетный перевод координат из CSV/TXT файла")
+    parser.add_argument("input", help="входной файл CSV/TXT")
+    parser.add_argument("output", help="выходной файл CSV")
+    parser.add_argument("-s", "--source", required=True,
+                        help="исходная СК: код EPSG или имя из словаря")
+    parser.add_argument("-t", "--target", required=True,
+                        help="целевая СК: код EPSG или имя из словаря")
+    parser.add_argument("--lon-col", type=int, default=0, help="номер столбца Долгота/X (с 0)")
+    parser.add_argument("--lat-col", type=int, default=1, help="номер столбца Широта/Y (с 0)")
+    parser.add_argument("--name-col", type=int, default=None, help="номер столбца Наименование (с 0)")
+    parser.add_argument("--sep", default=None,
+                        help="разделитель входного файла (по умолчанию ',' для .csv, пробелы для остальных)")
+    parser.add_argument("--out-sep", default=",", help="разделитель выходного файла")
+    parser.add_argument("--header", action="store_true", help="первая строка входного файла — заголовок")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="размер части в строках")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="число процессов пересчёта (0 — по числу ядер)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        rows, errors, unique = convert_file(args.input, args.output, args.source, args.target,
+                                    lon_col=args.lon_col, lat_col=args.lat_col,
+                                    name_col=args.name_col, sep=args.sep, out_sep=args.out_sep,
+                                    header=args.header, chunksize=args.chunksize,
+                                    workers=args.workers or None)
+    except (ValueError, OSError) as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Пересчитано строк: {rows}, ошибок: {errors}, уникальных точек: {unique}, "
+          f"время: {time.perf_counter() - start:.2f} с, кэш: {transformer_cache.stats()}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
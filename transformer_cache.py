@@ -0,0 +1,148 @@
+import json
+import os
+from collections import OrderedDict
+from threading import Lock
+
+from pyproj import Transformer
+from pyproj.database import get_database_metadata
+from pyproj.exceptions import CRSError, ProjError
+
+def default_store_path():
+    """Файл цепочек преобразований в каталоге кэша пользователя"""
+    base = (os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base, "perevod_koordinat", "pipelines.json")
+
+def proj_db_version():
+    """Версия базы PROJ: при её смене сохранённые цепочки недействительны"""
+    return "PROJ {} / EPSG {}".format(get_database_metadata("PROJ.VERSION"),
+                                      get_database_metadata("EPSG.VERSION"))
+
+class PipelineStore:
+    """Найденные PROJ цепочки преобразований по паре СК, сохраняемые на диск.
+
+    Поиск лучшей операции между СК повторяется при каждом запуске, а по
+    готовой цепочке Transformer строится сразу. Сохраняются только пары с одной
+    операцией: если PROJ выбирает операцию по координатам точек, цепочка
+    становится известна лишь при пересчёте, и такой Transformer строится как обычно
+    """
+    def __init__(self, path=None):
+        self.path = path or default_store_path()
+        self._pipelines = None
+        self._lock = Lock()
+
+    def _load(self):
+        if self._pipelines is None:
+            self._pipelines = {}
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    stored = json.load(f)
+                if stored.get('version') == proj_db_version():
+                    self._pipelines = dict(stored.get('pipelines', {}))
+            except (OSError, ValueError, AttributeError):
+                # Нет файла или он повреждён — начинаем с пустого кэша
+                pass
+        return self._pipelines
+
+    def get(self, key):
+        with self._lock:
+            return self._load().get(key)
+
+    def put(self, key, transformer):
+        """Запоминает цепочку Transformer, если она не зависит от координат точек"""
+        definition = transformer.definition
+        if transformer.name == "unknown" or not definition:
+            return
+        with self._lock:
+            pipelines = self._load()
+            if pipelines.get(key) == definition:
+                return
+            pipelines[key] = definition
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({'version': proj_db_version(), 'pipelines': pipelines}, f,
+                              ensure_ascii=False, indent=1)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                # Кэш на диске — только ускорение, без него всё работает
+                pass
+
+class TransformerCache:
+    """LRU-кэш объектов Transformer по паре СК (общий для окна и пакетного режима).
+
+    При промахе Transformer строится по цепочке из store, если она там есть
+    """
+    def __init__(self, maxsize=32, store=None):
+        self.maxsize = maxsize
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self._cache = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(source_crs, target_crs, options):
+        return (source_crs, target_crs, tuple(sorted(options.items())))
+
+    def get(self, source_crs, target_crs, **options):
+        """Возвращает Transformer из кэша или создаёт новый"""
+        key = self.make_key(source_crs, target_crs, options)
+        with self._lock:
+            transformer = self._cache.get(key)
+            if transformer is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return transformer
+            self.misses += 1
+
+        # Построение через базу PROJ выполняем без блокировки
+        store_key = repr(key)
+        pipeline = self.store.get(store_key) if self.store is not None else None
+        transformer = None
+        if pipeline is not None:
+            try:
+                transformer = Transformer.from_pipeline(pipeline)
+            except (ProjError, CRSError, TypeError):
+                # Цепочка испорчена или не читается этой сборкой PROJ — строим заново,
+                # и она перезаписывается в store
+                pass
+            else:
+                with self._lock:
+                    self.stored += 1
+        if transformer is None:
+            transformer = Transformer.from_crs(source_crs, target_crs, **options)
+            if self.store is not None:
+                self.store.put(store_key, transformer)
+
+        with self._lock:
+            self._cache[key] = transformer
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return transformer
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.stored = 0
+
+    def stats(self):
+        """Счётчики попаданий, промахов и Transformer, построенных по сохранённой цепочке"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'stored': self.stored,
+                    'size': len(self._cache), 'maxsize': self.maxsize}
+
+    def __len__(self):
+        return len(self._cache)
+
+#Общий кэш на процесс
+transformer_cache = TransformerCache(store=PipelineStore())
+
+def get_transformer(source_crs, target_crs, **options):
+    """Transformer для пары СК из общего кэша процесса"""
+    return transformer_cache.get(source_crs, target_crs, **options)
@@ -16,9 +16,9 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QApplication, QHBoxLayout, QHeaderView, QLabel,
-    QLineEdit, QListWidget, QListWidgetItem, QMainWindow,
-    QPushButton, QSizePolicy, QStatusBar, QTableView,
-    QVBoxLayout, QWidget)
+    QLineEdit, QListView, QMainWindow, QPushButton,
+    QSizePolicy, QStatusBar, QTableView, QVBoxLayout,
+    QWidget)
 
 class Ui_mainWindow(object):
     def setupUi(self, mainWindow):
@@ -39,7 +39,7 @@ class Ui_mainWindow(object):
 
         self.verticalLayout_3.addWidget(self.lineEdit)
 
-        self.listWidget = QListWidget(self.centralwidget)
+        self.listWidget = QListView(self.centralwidget)
         self.listWidget.setObjectName(u"listWidget")
         sizePolicy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         sizePolicy.setHorizontalStretch(0)
@@ -88,7 +88,7 @@ class Ui_mainWindow(object):
 
         self.verticalLayout.addWidget(self.lineEdit_2)
 
-        self.listWidget_2 = QListWidget(self.centralwidget)
+        self.listWidget_2 = QListView(self.centralwidget)
         self.listWidget_2.setObjectName(u"listWidget_2")
         sizePolicy.setHeightForWidth(self.listWidget_2.sizePolicy().hasHeightForWidth())
         self.listWidget_2.setSizePolicy(sizePolicy)